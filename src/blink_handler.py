@@ -9,16 +9,68 @@ This module handles all interactions with the Blink camera system on local netwo
 
 import asyncio
 import os
+import sys
+import time
 import logging
 from pathlib import Path
 import aiofiles
 import aiofiles.os
-from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
 
-logging.basicConfig(level=logging.INFO)
+# Prefer the native inotify backend on Linux; watchdog's generic Observer
+# can fall back to stat polling, which burns CPU on large storage trees.
+# The inotify module raises UnsupportedLibc (not ImportError) on libcs
+# without inotify support, e.g. musl.
+if sys.platform.startswith('linux'):
+    try:
+        from watchdog.utils import UnsupportedLibc
+    except ImportError:
+        # Renamed in watchdog 4.0
+        from watchdog.utils import UnsupportedLibcError as UnsupportedLibc
+    try:
+        from watchdog.observers.inotify import InotifyObserver as Observer
+    except (ImportError, UnsupportedLibc):
+        from watchdog.observers import Observer
+else:
+    from watchdog.observers import Observer
+
 logger = logging.getLogger(__name__)
 
+# Media extensions the file watcher cares about; frozensets keep the
+# per-event check a single O(1) membership test as suffixes grow
+_VIDEO_EXTS = frozenset({'.mp4', '.m4v'})
+_IMAGE_EXTS = frozenset({'.jpg', '.jpeg'})
+_MEDIA_EXTS = _VIDEO_EXTS | _IMAGE_EXTS
+
+# Canonical cache key -> every extension variant it covers, so directory
+# scans accept the same files the live watcher does
+_CACHE_SUFFIXES = {
+    '.mp4': tuple(_VIDEO_EXTS),
+    '.jpg': tuple(_IMAGE_EXTS),
+}
+
+# Coalesce bursts of file events per camera before alerting
+DEBOUNCE_SECONDS = 3.0
+# Delay between size reads when checking a file has finished writing
+SETTLE_CHECK_DELAY = 0.2
+
+def _latest_file(path, suffixes):
+    """Return the path of the newest file with one of the suffixes, or None.
+
+    Single streaming pass with os.scandir so each entry costs one cached
+    stat, instead of sorting the whole directory listing by mtime.
+    """
+    best_mtime = -1
+    best_path = None
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.name.lower().endswith(suffixes) and entry.is_file():
+                mtime = entry.stat().st_mtime
+                if mtime > best_mtime:
+                    best_mtime = mtime
+                    best_path = entry.path
+    return best_path
+
 class BlinkLocalHandler:
     def __init__(self, local_storage_path):
         """
@@ -29,66 +81,182 @@ class BlinkLocalHandler:
         """
         self.storage_path = Path(local_storage_path)
         self.cameras = {}  # Dictionary to store camera info
+        self._camera_names = frozenset()  # Snapshot for per-event lookups
+        # Incremental newest-file cache kept current by the filesystem
+        # watcher: suffix -> {camera_name: (mtime, path)}
+        self._latest = {'.mp4': {}, '.jpg': {}}
+        self._pending = {}  # camera_name -> asyncio.TimerHandle
+        self._loop = None
+        self._storage_prefix = str(self.storage_path) + os.sep
+        self.last_event_ts = 0.0  # monotonic time of the last motion event
         self.event_callbacks = []
         self.observer = Observer()
         
     async def initialize(self):
         """Initialize local camera monitoring"""
         try:
+            self._loop = asyncio.get_running_loop()
+
             # Verify storage path exists
             if not await aiofiles.os.path.exists(self.storage_path):
-                logger.error(f"Storage path not found: {self.storage_path}")
+                logger.error("Storage path not found: %s", self.storage_path)
                 return False
                 
             # Discover cameras by directory structure
             await self._discover_cameras()
-            
+
+            # Seed the newest-file cache so first queries are O(1) too
+            await self._seed_latest_cache()
+
             # Setup file system monitoring
-            event_handler = BlinkFileHandler(self._handle_new_video)
+            event_handler = BlinkFileHandler(self)
             self.observer.schedule(event_handler, str(self.storage_path), recursive=True)
             self.observer.start()
             
-            logger.info(f"Initialized local monitoring for {len(self.cameras)} cameras")
+            logger.info("Initialized local monitoring for %d cameras", len(self.cameras))
             return True
             
         except Exception as e:
-            logger.error(f"Error initializing local handler: {str(e)}")
+            logger.error("Error initializing local handler: %s", e)
             return False
             
     async def _discover_cameras(self):
         """Discover cameras from local storage structure"""
+        def _scan(root):
+            found = {}
+            with os.scandir(root) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        found[entry.name] = {
+                            'name': entry.name,
+                            'path': entry.path
+                        }
+            return found
+
         try:
-            async for entry in aiofiles.os.scandir(self.storage_path):
-                if await aiofiles.os.path.isdir(entry.path):
-                    camera_name = entry.name
-                    self.cameras[camera_name] = {
-                        'name': camera_name,
-                        'path': entry.path
-                    }
+            # One thread hop for the whole readdir instead of one per entry
+            self.cameras = await asyncio.to_thread(_scan, self.storage_path)
+            # Rebuilt only when the camera set changes, so the per-event
+            # handler reads a stable snapshot
+            self._camera_names = frozenset(self.cameras)
         except Exception as e:
-            logger.error(f"Error discovering cameras: {str(e)}")
+            logger.error("Error discovering cameras: %s", e)
             
-    def _handle_new_video(self, video_path):
-        """Handle new video file detection"""
-        camera_name = Path(video_path).parent.name
-        if camera_name in self.cameras:
-            for callback in self.event_callbacks:
-                asyncio.create_task(callback({
-                    'camera_name': camera_name,
-                    'video_path': video_path
-                }))
-                
+    async def _seed_latest_cache(self):
+        """Seed the newest-file cache, scanning camera directories in parallel"""
+        results = await asyncio.gather(
+            *(self._scan_and_cache(name, cache_key)
+              for name in self.cameras
+              for cache_key in self._latest),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error("Error seeding latest-file cache: %s", result)
+
+    async def _scan_and_cache(self, camera_name, cache_key):
+        """Scan a camera directory for its newest file and cache the result"""
+        camera_path = self.cameras[camera_name]['path']
+
+        def _scan():
+            path = _latest_file(camera_path, _CACHE_SUFFIXES[cache_key])
+            return (os.path.getmtime(path), path) if path else None
+
+        entry = await asyncio.to_thread(_scan)
+        if entry:
+            self._latest[cache_key][camera_name] = entry
+            return entry[1]
+        return None
+
+    def _camera_from_path(self, file_path):
+        """Extract the camera name from an event path.
+
+        The layout is fixed at <storage>/<camera>/<file>, so plain string
+        slicing avoids building a Path object per event.
+        """
+        return file_path[len(self._storage_prefix):].split(os.sep, 1)[0]
+
+    def _on_file_created(self, file_path, ext):
+        """Handle new file detection (runs on the observer thread)"""
+        camera_name = self._camera_from_path(file_path)
+        if camera_name not in self._camera_names:
+            return
+
+        cache_key = '.mp4' if ext in _VIDEO_EXTS else '.jpg'
+        self._latest[cache_key][camera_name] = (time.time(), file_path)
+
+        if ext in _VIDEO_EXTS:
+            # Timer and task management must happen on the event loop
+            # thread, not the observer thread
+            self._loop.call_soon_threadsafe(
+                self._handle_new_video, camera_name, file_path
+            )
+
+    def _on_file_deleted(self, file_path):
+        """Drop a cache entry when its file is removed"""
+        camera_name = self._camera_from_path(file_path)
+        for cache in self._latest.values():
+            entry = cache.get(camera_name)
+            if entry and entry[1] == file_path:
+                del cache[camera_name]
+
+    def _handle_new_video(self, camera_name, video_path):
+        """Handle new video file detection.
+
+        Runs on the event loop thread (posted via call_soon_threadsafe).
+        Blink writes can produce several events in quick succession for one
+        motion clip, so coalesce per camera: each new event resets a short
+        timer and only the last file seen in the window is dispatched.
+        """
+        pending = self._pending.pop(camera_name, None)
+        if pending:
+            pending.cancel()
+        self._pending[camera_name] = self._loop.call_later(
+            DEBOUNCE_SECONDS, self._flush_event, camera_name, video_path
+        )
+
+    def _flush_event(self, camera_name, video_path):
+        """Dispatch a debounced motion event"""
+        self._pending.pop(camera_name, None)
+        asyncio.create_task(self._dispatch_event(camera_name, video_path))
+
+    async def _dispatch_event(self, camera_name, video_path):
+        """Fire motion callbacks once the video file has settled"""
+        try:
+            size = os.path.getsize(video_path)
+            await asyncio.sleep(SETTLE_CHECK_DELAY)
+            if os.path.getsize(video_path) != size:
+                # Still being written; try again shortly. A newer event may
+                # have re-armed the timer during the settle sleep — defer to
+                # it instead of clobbering its handle
+                if camera_name not in self._pending:
+                    self._pending[camera_name] = self._loop.call_later(
+                        1.0, self._flush_event, camera_name, video_path
+                    )
+                return
+        except OSError:
+            return
+
+        self.last_event_ts = time.monotonic()
+        for callback in self.event_callbacks:
+            asyncio.create_task(callback({
+                'camera_name': camera_name,
+                'video_path': video_path
+            }))
+
     async def get_latest_video(self, camera_name):
         """Get most recent video for a camera"""
         if camera_name not in self.cameras:
             return None
             
-        camera_path = Path(self.cameras[camera_name]['path'])
+        cached = self._latest['.mp4'].get(camera_name)
+        if cached:
+            return cached[1]
+
         try:
-            videos = sorted(camera_path.glob('*.mp4'), key=os.path.getmtime, reverse=True)
-            return str(videos[0]) if videos else None
+            return await self._scan_and_cache(camera_name, '.mp4')
         except Exception as e:
-            logger.error(f"Error getting latest video: {str(e)}")
+            logger.error("Error getting latest video: %s", e)
             return None
             
     async def get_latest_image(self, camera_name):
@@ -96,12 +264,14 @@ class BlinkLocalHandler:
         if camera_name not in self.cameras:
             return None
             
-        camera_path = Path(self.cameras[camera_name]['path'])
+        cached = self._latest['.jpg'].get(camera_name)
+        if cached:
+            return cached[1]
+
         try:
-            images = sorted(camera_path.glob('*.jpg'), key=os.path.getmtime, reverse=True)
-            return str(images[0]) if images else None
+            return await self._scan_and_cache(camera_name, '.jpg')
         except Exception as e:
-            logger.error(f"Error getting latest image: {str(e)}")
+            logger.error("Error getting latest image: %s", e)
             return None
             
     def add_event_callback(self, callback):
@@ -109,9 +279,16 @@ class BlinkLocalHandler:
         self.event_callbacks.append(callback)
         
 class BlinkFileHandler(FileSystemEventHandler):
-    def __init__(self, callback):
-        self.callback = callback
-        
+    def __init__(self, handler):
+        self.handler = handler
+
     def on_created(self, event):
-        if not event.is_directory and event.src_path.endswith('.mp4'):
-            self.callback(event.src_path) 
\ No newline at end of file
+        if event.is_directory:
+            return
+        ext = os.path.splitext(event.src_path)[1].lower()
+        if ext in _MEDIA_EXTS:
+            self.handler._on_file_created(event.src_path, ext)
+
+    def on_deleted(self, event):
+        if not event.is_directory:
+            self.handler._on_file_deleted(event.src_path) 
\ No newline at end of file
@@ -5,25 +5,26 @@ This is the main module that coordinates between Blink cameras and Telegram noti
 It handles:
 - Continuous monitoring of Blink cameras
 - Processing of motion events
-- Video clip retrieval and temporary storage
 - Coordination of notifications via Telegram
 
 Dependencies:
 - blink_handler: For Blink camera operations
 - telegram_handler: For Telegram notifications
-- tempfile: For temporary video storage
 """
 
 import asyncio
 import os
 import logging
+import random
 from blink_handler import BlinkLocalHandler
 from telegram_handler import TelegramHandler
-import tempfile
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Error backoff bounds for the monitor loop (seconds)
+MIN_ERROR_BACKOFF = 5
+MAX_ERROR_BACKOFF = 300
+
 class BlinkMonitor:
     """
     Main monitoring system that coordinates between Blink cameras and Telegram notifications.
@@ -31,13 +32,11 @@ class BlinkMonitor:
     Attributes:
         blink_handler (BlinkLocalHandler): Handles Blink camera operations
         telegram_handler (TelegramHandler): Handles Telegram notifications
-        temp_dir (str): Directory for temporary video storage
     """
     def __init__(self, local_storage_path):
         self.blink_handler = BlinkLocalHandler(local_storage_path)
         self.telegram_handler = TelegramHandler()
-        self.temp_dir = tempfile.gettempdir()
-        
+
         # Set up cross-references
         self.telegram_handler.set_blink_handler(self.blink_handler)
         
@@ -57,7 +56,7 @@ class BlinkMonitor:
             await self.telegram_handler.send_motion_alert(camera_name, video_path)
             
         except Exception as e:
-            logger.error(f"Error handling motion event: {str(e)}")
+            logger.error("Error handling motion event: %s", e)
     
     async def monitor_loop(self):
         """Main monitoring loop"""
@@ -72,19 +71,35 @@ class BlinkMonitor:
         # Start bot polling in the background
         asyncio.create_task(self.telegram_handler.start_polling())
         
-        # Keep the application running
+        # Keep the application running. Block on the shutdown event instead
+        # of polling is_running() every second; the timeout is only a
+        # periodic liveness re-check.
+        error_backoff = MIN_ERROR_BACKOFF
+        shutdown = self.telegram_handler._shutdown
         while True:
             try:
                 if not await self.telegram_handler.is_running():
                     logger.info("Bot disconnected. Stopping monitor loop.")
                     break
-                    
-                await asyncio.sleep(1)
+
+                try:
+                    await asyncio.wait_for(shutdown.wait(), timeout=60)
+                except asyncio.TimeoutError:
+                    pass
+                error_backoff = MIN_ERROR_BACKOFF
             except Exception as e:
-                logger.error(f"Error in monitor loop: {str(e)}")
-                await asyncio.sleep(60)
+                logger.error("Error in monitor loop: %s", e)
+                # Exponential backoff with jitter to avoid hammering a
+                # failing dependency at a fixed cadence
+                await asyncio.sleep(
+                    error_backoff + random.uniform(-0.15, 0.15) * error_backoff
+                )
+                error_backoff = min(MAX_ERROR_BACKOFF, error_backoff * 2)
 
 async def main():
+    # Configure logging once for the whole application
+    logging.basicConfig(level=logging.INFO)
+
     local_storage_path = os.getenv('BLINK_LOCAL_STORAGE')
     if not local_storage_path:
         logger.error("BLINK_LOCAL_STORAGE environment variable not set")
@@ -12,8 +12,11 @@ Dependencies:
 - python-dotenv: For loading environment variables
 """
 
+import functools
 import os
-from telegram import Bot, Update
+import time
+import aiofiles
+from telegram import Update
 from telegram.constants import ParseMode
 from telegram.ext import Application, CommandHandler, ContextTypes
 import logging
@@ -22,29 +25,32 @@ import asyncio
 
 load_dotenv()
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-class TelegramHandler:
-    """
-    Handles Telegram bot operations and message sending.
-    
-    Attributes:
-        bot_token (str): Telegram bot API token from environment variables
-        chat_id (str): Target chat ID for sending notifications
-        bot (Bot): Telegram bot instance
-        app (Application): Telegram application instance
-        blink_handler (BlinkHandler): Reference to BlinkHandler for camera operations
-    """
-    
-    def __init__(self):
-        self.bot_token = os.getenv('TELEGRAM_BOT_TOKEN')
-        self.chat_id = os.getenv('TELEGRAM_CHAT_ID')
-        self.bot = Bot(self.bot_token)
-        self.app = Application.builder().token(self.bot_token).build()
-        self.blink_handler = None  # Will be set by monitor
-        self._running = True
-        self.HELP_TEXT = """
+# Max number of Telegram file_ids remembered for already-uploaded clips
+MEDIA_CACHE_SIZE = 256
+
+# Skip a Blink refresh entirely if one completed this recently (seconds)
+REFRESH_MIN_AGE = 2.0
+
+# Reuse the cached snapshot/clip if the same camera was asked again
+# within these windows (seconds)
+SNAP_TTL = 5.0
+RECORD_TTL = 15.0
+
+# Treat Blink state as fresh for this long after the local storage
+# watcher reported motion, and skip forced API refreshes (seconds)
+LOCAL_EVENT_GRACE = float(os.getenv('BLINK_LOCAL_EVENT_GRACE', '60'))
+
+@functools.cache
+def _bot_token():
+    return os.getenv('TELEGRAM_BOT_TOKEN')
+
+@functools.cache
+def _chat_id():
+    return os.getenv('TELEGRAM_CHAT_ID')
+
+_HELP_TEXT = """
 🤖 *Available Commands*
 
 📸 */dgetphoto* <camera_name>
@@ -63,19 +69,78 @@ class TelegramHandler:
 
 *Note:* Replace <camera_name> with your actual camera name
 """
-        
+
+class TelegramHandler:
+    """
+    Handles Telegram bot operations and message sending.
+    
+    Attributes:
+        bot_token (str): Telegram bot API token from environment variables
+        chat_id (str): Target chat ID for sending notifications
+        bot (Bot): Telegram bot instance
+        app (Application): Telegram application instance
+        blink_handler (BlinkHandler): Reference to BlinkHandler for camera operations
+    """
+    
+    def __init__(self):
+        self.bot_token = _bot_token()
+        self.chat_id = _chat_id()
+        # Built lazily in setup_handlers; constructing the Application
+        # spins up HTTP client state we don't need until the bot runs
+        self.bot = None
+        self.app = None
+        self.blink_handler = None  # Will be set by monitor
+        self._running = True
+        self._shutdown = asyncio.Event()
+        self._tg_media_cache = {}  # cache key -> Telegram file_id
+        self._refresh_task = None  # In-flight blink.refresh, if any
+        self._refresh_ts = 0.0
+        self._last_snap = {}  # camera_name -> last snap_picture time
+        self._last_rec = {}  # camera_name -> last record_video time
+
     def set_blink_handler(self, blink_handler):
         """Set the blink handler reference"""
         self.blink_handler = blink_handler
         
     async def setup_handlers(self):
         """Setup command handlers"""
+        self.app = Application.builder().token(self.bot_token).build()
+        # Share the Application's bot (and its HTTP client) instead of
+        # constructing a second Bot with its own connection pool
+        self.bot = self.app.bot
         self.app.add_handler(CommandHandler("dgetphoto", self.cmd_get_photo))
         self.app.add_handler(CommandHandler("dgetvideo", self.cmd_get_video))
         self.app.add_handler(CommandHandler("ddisconnect", self.cmd_disconnect))
         self.app.add_handler(CommandHandler("dhelp", self.cmd_help))
         self.app.add_handler(CommandHandler("start", self.cmd_help))
         
+    async def _refresh_blink(self, force=False):
+        """Refresh Blink state with single-flight deduplication.
+
+        Concurrent callers share the in-flight refresh instead of each
+        hitting the Blink API, and a refresh that finished within
+        REFRESH_MIN_AGE is not repeated unless forced.
+        """
+        # The local storage watcher just saw motion, so Blink state is
+        # fresh; downgrade a forced refresh to spare the API rate limit
+        if force and time.monotonic() - self.blink_handler.last_event_ts < LOCAL_EVENT_GRACE:
+            force = False
+
+        if not force and time.monotonic() - self._refresh_ts < REFRESH_MIN_AGE:
+            return
+
+        if self._refresh_task and not self._refresh_task.done():
+            await self._refresh_task
+            return
+
+        self._refresh_task = asyncio.create_task(
+            self.blink_handler.blink.refresh(force=force)
+        )
+        try:
+            await self._refresh_task
+        finally:
+            self._refresh_ts = time.monotonic()
+
     async def start_polling(self):
         """Start the bot polling"""
         await self.app.initialize()
@@ -99,10 +164,15 @@ class TelegramHandler:
                 await update.message.reply_text(f"Camera '{camera_name}' not found")
                 return
                 
-            # Take new photo
-            await camera.snap_picture()
-            await self.blink_handler.blink.refresh()
-            
+            # Take a new photo unless one was just taken for this camera;
+            # repeat requests within the TTL reuse the cached snapshot
+            if time.monotonic() - self._last_snap.get(camera_name, 0) >= SNAP_TTL:
+                await camera.snap_picture()
+                # Force so the fresh snapshot lands in the cache; the
+                # guard downgrades this after recent local motion
+                await self._refresh_blink(force=True)
+                self._last_snap[camera_name] = time.monotonic()
+
             # Get the latest image
             image_url = camera.image_from_cache
             await update.message.reply_photo(
@@ -111,7 +181,7 @@ class TelegramHandler:
             )
             
         except Exception as e:
-            logger.error(f"Error in dgetphoto command: {str(e)}")
+            logger.error("Error in dgetphoto command: %s", e)
             await update.message.reply_text(f"Error getting photo: {str(e)}")
             
     async def cmd_get_video(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -131,10 +201,15 @@ class TelegramHandler:
                 await update.message.reply_text(f"Camera '{camera_name}' not found")
                 return
                 
-            # Request a new video clip (5 seconds)
-            await camera.record_video()
-            await self.blink_handler.blink.refresh()
-            
+            # Request a new clip unless one was just recorded for this
+            # camera; repeat requests within the TTL reuse the cached clip
+            if time.monotonic() - self._last_rec.get(camera_name, 0) >= RECORD_TTL:
+                await camera.record_video()
+                # Force so the fresh clip lands in the cache; the guard
+                # downgrades this after recent local motion
+                await self._refresh_blink(force=True)
+                self._last_rec[camera_name] = time.monotonic()
+
             # Get the video URL
             video_url = camera.video_from_cache
             await update.message.reply_video(
@@ -143,18 +218,19 @@ class TelegramHandler:
             )
             
         except Exception as e:
-            logger.error(f"Error in dgetvideo command: {str(e)}")
+            logger.error("Error in dgetvideo command: %s", e)
             await update.message.reply_text(f"Error getting video: {str(e)}")
             
     async def cmd_disconnect(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle ddisconnect command"""
         try:
             self._running = False
+            self._shutdown.set()
             await update.message.reply_text(
                 "Bot disconnected. The application will stop monitoring until restarted."
             )
         except Exception as e:
-            logger.error(f"Error in ddisconnect command: {str(e)}")
+            logger.error("Error in ddisconnect command: %s", e)
             
     async def is_running(self):
         """Check if the bot is running"""
@@ -174,25 +250,60 @@ class TelegramHandler:
             )
             
             if video_path:
-                with open(video_path, 'rb') as video:
-                    await self.bot.send_video(
-                        chat_id=self.chat_id,
-                        video=video,
-                        caption=f"Motion video from {camera_name}"
-                    )
-            
-            logger.info(f"Alert sent for camera {camera_name}")
+                await self._send_video_file(camera_name, video_path)
+
+            logger.info("Alert sent for camera %s", camera_name)
         except Exception as e:
-            logger.error(f"Error sending Telegram alert: {str(e)}")
-            
+            logger.error("Error sending Telegram alert: %s", e)
+
+    async def _send_video_file(self, camera_name, video_path):
+        """Send a video clip, reusing Telegram's file_id for repeat sends.
+
+        Telegram re-attaches previously uploaded media server-side when
+        given its file_id, so a clip already sent once (e.g. retransmitted
+        by Blink) costs no upload bandwidth the second time.
+        """
+        caption = f"Motion video from {camera_name}"
+        try:
+            stat = os.stat(video_path)
+            cache_key = f"{stat.st_size}:{int(stat.st_mtime)}:{camera_name}"
+        except OSError:
+            cache_key = None
+
+        file_id = self._tg_media_cache.get(cache_key) if cache_key else None
+        if file_id:
+            await self.bot.send_video(
+                chat_id=self.chat_id,
+                video=file_id,
+                caption=caption
+            )
+            return
+
+        # Read the clip with aiofiles so the event loop is not blocked;
+        # python-telegram-bot does a synchronous read when handed a path
+        # or file object
+        async with aiofiles.open(video_path, 'rb') as f:
+            data = await f.read()
+        message = await self.bot.send_video(
+            chat_id=self.chat_id,
+            video=data,
+            caption=caption,
+            filename=os.path.basename(video_path)
+        )
+
+        if cache_key and message and message.video:
+            if len(self._tg_media_cache) >= MEDIA_CACHE_SIZE:
+                self._tg_media_cache.pop(next(iter(self._tg_media_cache)))
+            self._tg_media_cache[cache_key] = message.video.file_id
+
     async def cmd_help(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle help command"""
         try:
             await update.message.reply_text(
-                self.HELP_TEXT,
+                _HELP_TEXT,
                 parse_mode=ParseMode.MARKDOWN,
                 disable_web_page_preview=True
             )
         except Exception as e:
-            logger.error(f"Error sending help message: {str(e)}")
+            logger.error("Error sending help message: %s", e)
             await update.message.reply_text("Error displaying help message. Please try again.") 
\ No newline at end of file